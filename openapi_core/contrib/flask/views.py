@@ -21,8 +21,10 @@ class FlaskOpenAPIView(MethodView):
             errors_handler_cls=self.openapi_errors_handler,
             **unmarshaller_kwargs,
         )
+        # unbound, a bound method kept on the view would be a cycle
+        self._dispatch_request = self.decorator(MethodView.dispatch_request)
 
     def dispatch_request(self, *args: Any, **kwargs: Any) -> Any:
-        response = self.decorator(super().dispatch_request)(*args, **kwargs)
+        response = self._dispatch_request(self, *args, **kwargs)
 
         return response
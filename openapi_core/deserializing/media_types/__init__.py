@@ -1,4 +1,3 @@
-from json import loads as json_loads
 from xml.etree.ElementTree import fromstring as xml_loads
 
 from openapi_core.deserializing.media_types.datatypes import (
@@ -8,6 +7,7 @@ from openapi_core.deserializing.media_types.factories import (
     MediaTypeDeserializersFactory,
 )
 from openapi_core.deserializing.media_types.util import data_form_loads
+from openapi_core.deserializing.media_types.util import json_loads
 from openapi_core.deserializing.media_types.util import plain_loads
 from openapi_core.deserializing.media_types.util import urlencoded_form_loads
 
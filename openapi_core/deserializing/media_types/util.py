@@ -1,4 +1,5 @@
 from email.parser import Parser
+from json import loads
 from typing import Any
 from typing import Dict
 from typing import Union
@@ -18,6 +19,11 @@ def plain_loads(value: Union[str, bytes], **parameters: str) -> str:
     return value
 
 
+def json_loads(value: Union[str, bytes], **parameters: str) -> Any:
+    # The json module detects bytes encoding itself
+    return loads(value)
+
+
 def urlencoded_form_loads(value: Any, **parameters: str) -> Dict[str, Any]:
     return dict(parse_qsl(value))
 
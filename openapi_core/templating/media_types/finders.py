@@ -1,5 +1,7 @@
 """OpenAPI core templating media types finders module"""
 import fnmatch
+from functools import cached_property
+from typing import Dict
 from typing import Mapping
 from typing import Tuple
 
@@ -12,28 +14,33 @@ class MediaTypeFinder:
     def __init__(self, content: Spec):
         self.content = content
 
+    @cached_property
+    def _media_types(self) -> Dict[str, Spec]:
+        return dict(self.content.items())
+
     def get_first(self) -> MediaType:
-        mimetype, media_type = next(self.content.items())
+        mimetype, media_type = next(iter(self._media_types.items()))
         return MediaType(mimetype, {}, media_type)
 
     def find(self, mimetype: str) -> MediaType:
+        media_types = self._media_types
         if mimetype is None:
-            raise MediaTypeNotFound(mimetype, list(self.content.keys()))
+            raise MediaTypeNotFound(mimetype, list(media_types))
 
         mime_type, parameters = self._parse_mimetype(mimetype)
 
         # simple mime type
         for m in [mimetype, mime_type]:
-            if m in self.content:
-                return MediaType(mime_type, parameters, self.content / m)
+            if m in media_types:
+                return MediaType(mime_type, parameters, media_types[m])
 
         # range mime type
         if mime_type:
-            for key, value in self.content.items():
+            for key, value in media_types.items():
                 if fnmatch.fnmatch(mime_type, key):
                     return MediaType(key, parameters, value)
 
-        raise MediaTypeNotFound(mimetype, list(self.content.keys()))
+        raise MediaTypeNotFound(mimetype, list(media_types))
 
     def _parse_mimetype(self, mimetype: str) -> Tuple[str, Mapping[str, str]]:
         mimetype_parts = mimetype.split("; ")
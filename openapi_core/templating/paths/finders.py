@@ -1,7 +1,9 @@
 """OpenAPI core templating paths finders module"""
+from functools import cached_property
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from urllib.parse import urljoin
 from urllib.parse import urlparse
 
@@ -73,12 +75,16 @@ class APICallPathFinder(BasePathFinder):
         self.spec = spec
         self.base_url = base_url
 
-    def _get_paths_iter(self, name: str) -> Iterator[Path]:
+    @cached_property
+    def _paths(self) -> List[Tuple[str, Spec]]:
         paths = self.spec / "paths"
         if not paths.exists():
             raise PathsNotFound(paths.uri())
+        return list(paths.items())
+
+    def _get_paths_iter(self, name: str) -> Iterator[Path]:
         template_paths: List[Path] = []
-        for path_pattern, path in list(paths.items()):
+        for path_pattern, path in self._paths:
             # simple path.
             # Return right away since it is always the most concrete
             if name.endswith(path_pattern):
@@ -142,11 +148,15 @@ class APICallPathFinder(BasePathFinder):
 
 
 class WebhookPathFinder(BasePathFinder):
-    def _get_paths_iter(self, name: str) -> Iterator[Path]:
+    @cached_property
+    def _webhooks(self) -> List[Tuple[str, Spec]]:
         webhooks = self.spec / "webhooks"
         if not webhooks.exists():
             raise PathsNotFound(webhooks.uri())
-        for webhook_name, path in list(webhooks.items()):
+        return list(webhooks.items())
+
+    def _get_paths_iter(self, name: str) -> Iterator[Path]:
+        for webhook_name, path in self._webhooks:
             if name == webhook_name:
                 path_result = TemplateResult(webhook_name, {})
                 yield Path(path, path_result)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 from typing import Optional
 
@@ -24,15 +25,27 @@ class PathParameter:
 parse_path_parameter = PathParameter()
 
 
-def search(path_pattern: str, full_url_pattern: str) -> Optional[Match]:
+@lru_cache(maxsize=None)
+def _get_search_parser(path_pattern: str) -> ExtendedParser:
     extra_types = {parse_path_parameter.name: parse_path_parameter}
     p = ExtendedParser(path_pattern, extra_types)
     p._expression = p._expression + "$"
-    return p.search(full_url_pattern)
+    return p
 
 
-def parse(server_url: str, server_url_pattern: str) -> Match:
+@lru_cache(maxsize=None)
+def _get_parse_parser(server_url: str) -> ExtendedParser:
     extra_types = {parse_path_parameter.name: parse_path_parameter}
     p = ExtendedParser(server_url, extra_types)
     p._expression = "^" + p._expression
+    return p
+
+
+def search(path_pattern: str, full_url_pattern: str) -> Optional[Match]:
+    p = _get_search_parser(path_pattern)
+    return p.search(full_url_pattern)
+
+
+def parse(server_url: str, server_url_pattern: str) -> Match:
+    p = _get_parse_parser(server_url)
     return p.parse(server_url_pattern)
@@ -1,7 +1,14 @@
+from concurrent.futures import Executor
+from typing import Any
+from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 from openapi_core.casting.schemas import schema_casters_factory
 from openapi_core.casting.schemas.factories import SchemaCastersFactory
+from openapi_core.datatypes import Parameters
+from openapi_core.datatypes import RequestParameters
 from openapi_core.deserializing.media_types import (
     media_type_deserializers_factory,
 )
@@ -15,6 +22,7 @@ from openapi_core.deserializing.styles import style_deserializers_factory
 from openapi_core.deserializing.styles.factories import (
     StyleDeserializersFactory,
 )
+from openapi_core.exceptions import OpenAPIError
 from openapi_core.protocols import BaseRequest
 from openapi_core.protocols import Request
 from openapi_core.protocols import WebhookRequest
@@ -32,11 +40,14 @@ from openapi_core.unmarshalling.schemas import (
 from openapi_core.unmarshalling.schemas.datatypes import (
     FormatUnmarshallersDict,
 )
+from openapi_core.unmarshalling.schemas.exceptions import (
+    FormatterNotFoundError,
+)
 from openapi_core.unmarshalling.schemas.factories import (
     SchemaUnmarshallersFactory,
 )
+from openapi_core.unmarshalling.schemas.unmarshallers import SchemaUnmarshaller
 from openapi_core.unmarshalling.unmarshallers import BaseUnmarshaller
-from openapi_core.util import chainiters
 from openapi_core.validation.request.exceptions import MissingRequestBody
 from openapi_core.validation.request.exceptions import ParametersError
 from openapi_core.validation.request.exceptions import (
@@ -76,6 +87,8 @@ from openapi_core.validation.request.validators import (
 from openapi_core.validation.request.validators import WebhookRequestValidator
 from openapi_core.validation.schemas.datatypes import FormatValidatorsDict
 from openapi_core.validation.schemas.factories import SchemaValidatorsFactory
+from openapi_core.validation.validators import BaseAPICallValidator
+from openapi_core.validation.validators import BaseWebhookValidator
 
 
 class BaseRequestUnmarshaller(BaseRequestValidator, BaseUnmarshaller):
@@ -98,9 +111,10 @@ class BaseRequestUnmarshaller(BaseRequestValidator, BaseUnmarshaller):
         ] = None,
         format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
         extra_format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
+        precompile: bool = False,
+        executor: Optional[Executor] = None,
     ):
-        BaseUnmarshaller.__init__(
-            self,
+        super().__init__(
             spec,
             base_url=base_url,
             schema_casters_factory=schema_casters_factory,
@@ -110,52 +124,148 @@ class BaseRequestUnmarshaller(BaseRequestValidator, BaseUnmarshaller):
             format_validators=format_validators,
             extra_format_validators=extra_format_validators,
             extra_media_type_deserializers=extra_media_type_deserializers,
+            security_provider_factory=security_provider_factory,
             schema_unmarshallers_factory=schema_unmarshallers_factory,
             format_unmarshallers=format_unmarshallers,
             extra_format_unmarshallers=extra_format_unmarshallers,
         )
-        BaseRequestValidator.__init__(
-            self,
-            spec,
-            base_url=base_url,
-            schema_casters_factory=schema_casters_factory,
-            style_deserializers_factory=style_deserializers_factory,
-            media_type_deserializers_factory=media_type_deserializers_factory,
-            schema_validators_factory=schema_validators_factory,
-            format_validators=format_validators,
-            extra_format_validators=extra_format_validators,
-            extra_media_type_deserializers=extra_media_type_deserializers,
-            security_provider_factory=security_provider_factory,
-        )
+        # runs security, parameters and body steps concurrently if set
+        self.executor = executor
+        # compiled schema unmarshallers reused across requests
+        self._schema_unmarshallers: Dict[Spec, SchemaUnmarshaller] = {}
+        # operation (has parameters, has request body) flags
+        self._operation_flags: Dict[Spec, Tuple[bool, bool]] = {}
+        # precompile once the unmarshaller caches exist
+        if precompile:
+            self._precompile_all()
+
+    def _get_schema_unmarshaller(self, schema: Spec) -> SchemaUnmarshaller:
+        try:
+            return self._schema_unmarshallers[schema]
+        except KeyError:
+            unmarshaller = super()._get_schema_unmarshaller(schema)
+            self._schema_unmarshallers[schema] = unmarshaller
+            return unmarshaller
 
-    def _unmarshal(
-        self, request: BaseRequest, operation: Spec, path: Spec
-    ) -> RequestUnmarshalResult:
+    def _precompile_operation(self, operation: Spec, path: Spec) -> None:
+        super()._precompile_operation(operation, path)
+        self._get_operation_flags(operation, path)
+
+    def _precompile_schema(self, schema: Spec) -> None:
+        try:
+            self._get_schema_unmarshaller(schema)
+        # leave unknown formats to be reported on request
+        except FormatterNotFoundError:
+            pass
+
+    def _get_operation_flags(
+        self, operation: Spec, path: Spec
+    ) -> Tuple[bool, bool]:
         try:
-            security = self._get_security(request.parameters, operation)
+            return self._operation_flags[operation]
+        except KeyError:
+            has_params = "parameters" in operation or "parameters" in path
+            has_body = self._get_operation_request_body(operation) is not None
+            flags = (has_params, has_body)
+            self._operation_flags[operation] = flags
+            return flags
+
+    def _try_get_security(
+        self, parameters: RequestParameters, operation: Spec
+    ) -> Tuple[Optional[Dict[str, str]], List[OpenAPIError]]:
+        try:
+            security = self._get_security(parameters, operation)
         except SecurityValidationError as exc:
-            return RequestUnmarshalResult(errors=[exc])
+            return None, [exc]
+        return security, []
 
+    def _try_get_parameters(
+        self, parameters: RequestParameters, operation: Spec, path: Spec
+    ) -> Tuple[Parameters, List[OpenAPIError]]:
         try:
-            params = self._get_parameters(request.parameters, operation, path)
+            params = self._get_parameters(parameters, operation, path)
         except ParametersError as exc:
-            params = exc.parameters
-            params_errors = exc.errors
-        else:
-            params_errors = []
+            return exc.parameters, list(exc.errors)
+        return params, []
 
+    def _try_get_body(
+        self, body: Optional[str], mimetype: str, operation: Spec
+    ) -> Tuple[Any, List[OpenAPIError]]:
         try:
-            body = self._get_body(request.body, request.mimetype, operation)
+            body = self._get_body(body, mimetype, operation)
         except MissingRequestBody:
-            body = None
-            body_errors = []
+            return None, []
         except RequestBodyValidationError as exc:
-            body = None
-            body_errors = [exc]
-        else:
-            body_errors = []
+            return None, [exc]
+        return body, []
+
+    def _unmarshal(
+        self, request: BaseRequest, operation: Spec, path: Spec
+    ) -> RequestUnmarshalResult:
+        has_params, has_body = self._get_operation_flags(operation, path)
+        if self.executor is not None and (has_params or has_body):
+            return self._unmarshal_concurrently(
+                self.executor, request, operation, path
+            )
+
+        security, security_errors = self._try_get_security(
+            request.parameters, operation
+        )
+        if security_errors:
+            return RequestUnmarshalResult(errors=security_errors)
+
+        # nothing else to unmarshal
+        if not has_params and not has_body:
+            return RequestUnmarshalResult(errors=[], security=security)
+
+        params, params_errors = self._try_get_parameters(
+            request.parameters, operation, path
+        )
+        body, body_errors = self._try_get_body(
+            request.body, request.mimetype, operation
+        )
+
+        errors = params_errors + body_errors if body_errors else params_errors
+        return RequestUnmarshalResult(
+            errors=errors,
+            body=body,
+            parameters=params,
+            security=security,
+        )
 
-        errors = list(chainiters(params_errors, body_errors))
+    def _unmarshal_concurrently(
+        self,
+        executor: Executor,
+        request: BaseRequest,
+        operation: Spec,
+        path: Spec,
+    ) -> RequestUnmarshalResult:
+        # read the request on the calling thread, framework requests
+        # may only be accessible there (e.g. flask request proxy)
+        parameters = request.parameters
+        body = request.body
+        mimetype = request.mimetype
+
+        security_future = executor.submit(
+            self._try_get_security, parameters, operation
+        )
+        params_future = executor.submit(
+            self._try_get_parameters, parameters, operation, path
+        )
+        body_future = executor.submit(
+            self._try_get_body, body, mimetype, operation
+        )
+
+        security, security_errors = security_future.result()
+        if security_errors:
+            params_future.cancel()
+            body_future.cancel()
+            return RequestUnmarshalResult(errors=security_errors)
+
+        params, params_errors = params_future.result()
+        body, body_errors = body_future.result()
+
+        errors = params_errors + body_errors if body_errors else params_errors
         return RequestUnmarshalResult(
             errors=errors,
             body=body,
@@ -166,16 +276,9 @@ class BaseRequestUnmarshaller(BaseRequestValidator, BaseUnmarshaller):
     def _unmarshal_body(
         self, request: BaseRequest, operation: Spec, path: Spec
     ) -> RequestUnmarshalResult:
-        try:
-            body = self._get_body(request.body, request.mimetype, operation)
-        except MissingRequestBody:
-            body = None
-            errors = []
-        except RequestBodyValidationError as exc:
-            body = None
-            errors = [exc]
-        else:
-            errors = []
+        body, errors = self._try_get_body(
+            request.body, request.mimetype, operation
+        )
 
         return RequestUnmarshalResult(
             errors=errors,
@@ -185,13 +288,9 @@ class BaseRequestUnmarshaller(BaseRequestValidator, BaseUnmarshaller):
     def _unmarshal_parameters(
         self, request: BaseRequest, operation: Spec, path: Spec
     ) -> RequestUnmarshalResult:
-        try:
-            params = self._get_parameters(request.parameters, path, operation)
-        except ParametersError as exc:
-            params = exc.parameters
-            params_errors = exc.errors
-        else:
-            params_errors = []
+        params, params_errors = self._try_get_parameters(
+            request.parameters, operation, path
+        )
 
         return RequestUnmarshalResult(
             errors=params_errors,
@@ -201,158 +300,123 @@ class BaseRequestUnmarshaller(BaseRequestValidator, BaseUnmarshaller):
     def _unmarshal_security(
         self, request: BaseRequest, operation: Spec, path: Spec
     ) -> RequestUnmarshalResult:
-        try:
-            security = self._get_security(request.parameters, operation)
-        except SecurityValidationError as exc:
-            return RequestUnmarshalResult(errors=[exc])
+        security, errors = self._try_get_security(
+            request.parameters, operation
+        )
 
         return RequestUnmarshalResult(
-            errors=[],
+            errors=errors,
             security=security,
         )
 
-
-class BaseAPICallRequestUnmarshaller(BaseRequestUnmarshaller):
-    pass
-
-
-class BaseWebhookRequestUnmarshaller(BaseRequestUnmarshaller):
-    pass
+    def _unmarshal_operation(
+        self, request: BaseRequest, operation: Spec, path: Spec
+    ) -> RequestUnmarshalResult:
+        # operation unmarshalling step run by unmarshal
+        return self._unmarshal(request, operation, path)
 
 
-class APICallRequestUnmarshaller(
-    APICallRequestValidator, BaseAPICallRequestUnmarshaller
+class BaseAPICallRequestUnmarshaller(
+    BaseRequestUnmarshaller, BaseAPICallValidator
 ):
     def unmarshal(self, request: Request) -> RequestUnmarshalResult:
         try:
-            path, operation, _, path_result, _ = self._find_path(request)
+            path, operation, _, path_result, _ = self._find_path_cached(
+                request
+            )
         # don't process if operation errors
         except PathError as exc:
             return RequestUnmarshalResult(errors=[exc])
 
-        request.parameters.path = (
-            request.parameters.path or path_result.variables
-        )
+        parameters = request.parameters
+        if not parameters.path:
+            parameters.path = path_result.variables
 
-        return self._unmarshal(request, operation, path)
+        return self._unmarshal_operation(request, operation, path)
 
 
-class APICallRequestBodyUnmarshaller(
-    APICallRequestValidator, BaseAPICallRequestUnmarshaller
+class BaseWebhookRequestUnmarshaller(
+    BaseRequestUnmarshaller, BaseWebhookValidator
 ):
-    def unmarshal(self, request: Request) -> RequestUnmarshalResult:
+    def unmarshal(self, request: WebhookRequest) -> RequestUnmarshalResult:
         try:
-            path, operation, _, path_result, _ = self._find_path(request)
+            path, operation, _, path_result, _ = self._find_path_cached(
+                request
+            )
         # don't process if operation errors
         except PathError as exc:
             return RequestUnmarshalResult(errors=[exc])
 
-        request.parameters.path = (
-            request.parameters.path or path_result.variables
-        )
+        parameters = request.parameters
+        if not parameters.path:
+            parameters.path = path_result.variables
 
-        return self._unmarshal_body(request, operation, path)
+        return self._unmarshal_operation(request, operation, path)
 
 
-class APICallRequestParametersUnmarshaller(
+class APICallRequestUnmarshaller(
     APICallRequestValidator, BaseAPICallRequestUnmarshaller
 ):
-    def unmarshal(self, request: Request) -> RequestUnmarshalResult:
-        try:
-            path, operation, _, path_result, _ = self._find_path(request)
-        # don't process if operation errors
-        except PathError as exc:
-            return RequestUnmarshalResult(errors=[exc])
+    pass
 
-        request.parameters.path = (
-            request.parameters.path or path_result.variables
-        )
 
-        return self._unmarshal_parameters(request, operation, path)
+class APICallRequestBodyUnmarshaller(
+    APICallRequestValidator, BaseAPICallRequestUnmarshaller
+):
+    def _unmarshal_operation(
+        self, request: BaseRequest, operation: Spec, path: Spec
+    ) -> RequestUnmarshalResult:
+        return self._unmarshal_body(request, operation, path)
 
 
-class APICallRequestSecurityUnmarshaller(
+class APICallRequestParametersUnmarshaller(
     APICallRequestValidator, BaseAPICallRequestUnmarshaller
 ):
-    def unmarshal(self, request: Request) -> RequestUnmarshalResult:
-        try:
-            path, operation, _, path_result, _ = self._find_path(request)
-        # don't process if operation errors
-        except PathError as exc:
-            return RequestUnmarshalResult(errors=[exc])
+    def _unmarshal_operation(
+        self, request: BaseRequest, operation: Spec, path: Spec
+    ) -> RequestUnmarshalResult:
+        return self._unmarshal_parameters(request, operation, path)
 
-        request.parameters.path = (
-            request.parameters.path or path_result.variables
-        )
 
+class APICallRequestSecurityUnmarshaller(
+    APICallRequestValidator, BaseAPICallRequestUnmarshaller
+):
+    def _unmarshal_operation(
+        self, request: BaseRequest, operation: Spec, path: Spec
+    ) -> RequestUnmarshalResult:
         return self._unmarshal_security(request, operation, path)
 
 
 class WebhookRequestUnmarshaller(
     WebhookRequestValidator, BaseWebhookRequestUnmarshaller
 ):
-    def unmarshal(self, request: WebhookRequest) -> RequestUnmarshalResult:
-        try:
-            path, operation, _, path_result, _ = self._find_path(request)
-        # don't process if operation errors
-        except PathError as exc:
-            return RequestUnmarshalResult(errors=[exc])
-
-        request.parameters.path = (
-            request.parameters.path or path_result.variables
-        )
-
-        return self._unmarshal(request, operation, path)
+    pass
 
 
 class WebhookRequestBodyUnmarshaller(
     WebhookRequestValidator, BaseWebhookRequestUnmarshaller
 ):
-    def unmarshal(self, request: WebhookRequest) -> RequestUnmarshalResult:
-        try:
-            path, operation, _, path_result, _ = self._find_path(request)
-        # don't process if operation errors
-        except PathError as exc:
-            return RequestUnmarshalResult(errors=[exc])
-
-        request.parameters.path = (
-            request.parameters.path or path_result.variables
-        )
-
+    def _unmarshal_operation(
+        self, request: BaseRequest, operation: Spec, path: Spec
+    ) -> RequestUnmarshalResult:
         return self._unmarshal_body(request, operation, path)
 
 
 class WebhookRequestParametersUnmarshaller(
     WebhookRequestValidator, BaseWebhookRequestUnmarshaller
 ):
-    def unmarshal(self, request: WebhookRequest) -> RequestUnmarshalResult:
-        try:
-            path, operation, _, path_result, _ = self._find_path(request)
-        # don't process if operation errors
-        except PathError as exc:
-            return RequestUnmarshalResult(errors=[exc])
-
-        request.parameters.path = (
-            request.parameters.path or path_result.variables
-        )
-
+    def _unmarshal_operation(
+        self, request: BaseRequest, operation: Spec, path: Spec
+    ) -> RequestUnmarshalResult:
         return self._unmarshal_parameters(request, operation, path)
 
 
 class WebhookRequestSecuritysUnmarshaller(
     WebhookRequestValidator, BaseWebhookRequestUnmarshaller
 ):
-    def unmarshal(self, request: WebhookRequest) -> RequestUnmarshalResult:
-        try:
-            path, operation, _, path_result, _ = self._find_path(request)
-        # don't process if operation errors
-        except PathError as exc:
-            return RequestUnmarshalResult(errors=[exc])
-
-        request.parameters.path = (
-            request.parameters.path or path_result.variables
-        )
-
+    def _unmarshal_operation(
+        self, request: BaseRequest, operation: Spec, path: Spec
+    ) -> RequestUnmarshalResult:
         return self._unmarshal_security(request, operation, path)
 
 
@@ -154,7 +154,7 @@ class APICallResponseUnmarshaller(
         response: Response,
     ) -> ResponseUnmarshalResult:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         # don't process if operation errors
         except PathError as exc:
             return ResponseUnmarshalResult(errors=[exc])
@@ -171,7 +171,7 @@ class APICallResponseDataUnmarshaller(
         response: Response,
     ) -> ResponseUnmarshalResult:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         # don't process if operation errors
         except PathError as exc:
             return ResponseUnmarshalResult(errors=[exc])
@@ -188,7 +188,7 @@ class APICallResponseHeadersUnmarshaller(
         response: Response,
     ) -> ResponseUnmarshalResult:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         # don't process if operation errors
         except PathError as exc:
             return ResponseUnmarshalResult(errors=[exc])
@@ -205,7 +205,7 @@ class WebhookResponseUnmarshaller(
         response: Response,
     ) -> ResponseUnmarshalResult:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         # don't process if operation errors
         except PathError as exc:
             return ResponseUnmarshalResult(errors=[exc])
@@ -222,7 +222,7 @@ class WebhookResponseDataUnmarshaller(
         response: Response,
     ) -> ResponseUnmarshalResult:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         # don't process if operation errors
         except PathError as exc:
             return ResponseUnmarshalResult(errors=[exc])
@@ -239,7 +239,7 @@ class WebhookResponseHeadersUnmarshaller(
         response: Response,
     ) -> ResponseUnmarshalResult:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         # don't process if operation errors
         except PathError as exc:
             return ResponseUnmarshalResult(errors=[exc])
@@ -39,7 +39,7 @@ class PrimitiveUnmarshaller:
 
 class ArrayUnmarshaller(PrimitiveUnmarshaller):
     def __call__(self, value: Any) -> Optional[List[Any]]:
-        return list(map(self.items_unmarshaller.unmarshal, value))
+        return list(map(self.items_unmarshaller._unmarshal, value))
 
     @property
     def items_unmarshaller(self) -> "SchemaUnmarshaller":
@@ -99,16 +99,20 @@ class ObjectUnmarshaller(PrimitiveUnmarshaller):
             properties.update(all_of_properties)
 
         for prop_name, prop_schema in get_properties(self.schema).items():
+            prop_unmarshaller = self.schema_unmarshaller.evolve(prop_schema)
             try:
                 prop_value = value[prop_name]
             except KeyError:
                 if "default" not in prop_schema:
                     continue
-                prop_value = prop_schema["default"]
-
-            properties[prop_name] = self.schema_unmarshaller.evolve(
-                prop_schema
-            ).unmarshal(prop_value)
+                # defaults are not covered by the object validation
+                properties[prop_name] = prop_unmarshaller.unmarshal(
+                    prop_schema["default"]
+                )
+            else:
+                properties[prop_name] = prop_unmarshaller._unmarshal(
+                    prop_value
+                )
 
         if schema_only:
             return properties
@@ -131,7 +135,7 @@ class ObjectUnmarshaller(PrimitiveUnmarshaller):
             for prop_name, prop_value in value.items():
                 if prop_name in properties:
                     continue
-                properties[prop_name] = additional_prop_unmarshaler.unmarshal(
+                properties[prop_name] = additional_prop_unmarshaler._unmarshal(
                     prop_value
                 )
 
@@ -262,7 +266,10 @@ class SchemaUnmarshaller:
 
     def unmarshal(self, value: Any) -> Any:
         self.schema_validator.validate(value)
+        return self._unmarshal(value)
 
+    def _unmarshal(self, value: Any) -> Any:
+        # value already validated against the schema
         # skip unmarshalling for nullable in OpenAPI 3.0
         if value is None and self.schema.getkey("nullable", False):
             return value
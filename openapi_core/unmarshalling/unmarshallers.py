@@ -25,6 +25,7 @@ from openapi_core.unmarshalling.schemas.datatypes import (
 from openapi_core.unmarshalling.schemas.factories import (
     SchemaUnmarshallersFactory,
 )
+from openapi_core.unmarshalling.schemas.unmarshallers import SchemaUnmarshaller
 from openapi_core.validation.schemas.datatypes import FormatValidatorsDict
 from openapi_core.validation.schemas.factories import SchemaValidatorsFactory
 from openapi_core.validation.validators import BaseValidator
@@ -77,14 +78,17 @@ class BaseUnmarshaller(BaseValidator):
         self.format_unmarshallers = format_unmarshallers
         self.extra_format_unmarshallers = extra_format_unmarshallers
 
-    def _unmarshal_schema(self, schema: Spec, value: Any) -> Any:
-        unmarshaller = self.schema_unmarshallers_factory.create(
+    def _get_schema_unmarshaller(self, schema: Spec) -> SchemaUnmarshaller:
+        return self.schema_unmarshallers_factory.create(
             schema,
             format_validators=self.format_validators,
             extra_format_validators=self.extra_format_validators,
             format_unmarshallers=self.format_unmarshallers,
             extra_format_unmarshallers=self.extra_format_unmarshallers,
         )
+
+    def _unmarshal_schema(self, schema: Spec, value: Any) -> Any:
+        unmarshaller = self._get_schema_unmarshaller(schema)
         return unmarshaller.unmarshal(value)
 
     def _convert_schema_style_value(
@@ -1,9 +1,14 @@
 """OpenAPI core validation request validators module"""
+from __future__ import annotations
+
 import warnings
+from functools import cached_property
 from typing import Any
 from typing import Dict
 from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 from openapi_core.casting.schemas import schema_casters_factory
 from openapi_core.casting.schemas.factories import SchemaCastersFactory
@@ -22,12 +27,14 @@ from openapi_core.deserializing.styles import style_deserializers_factory
 from openapi_core.deserializing.styles.factories import (
     StyleDeserializersFactory,
 )
+from openapi_core.exceptions import OpenAPIError
 from openapi_core.protocols import BaseRequest
 from openapi_core.protocols import Request
 from openapi_core.protocols import WebhookRequest
 from openapi_core.security import security_provider_factory
 from openapi_core.security.exceptions import SecurityProviderError
 from openapi_core.security.factories import SecurityProviderFactory
+from openapi_core.security.providers import BaseProvider
 from openapi_core.spec.paths import Spec
 from openapi_core.templating.paths.exceptions import PathError
 from openapi_core.templating.paths.finders import WebhookPathFinder
@@ -54,11 +61,23 @@ from openapi_core.validation.schemas import (
 )
 from openapi_core.validation.schemas import oas31_schema_validators_factory
 from openapi_core.validation.schemas.datatypes import FormatValidatorsDict
+from openapi_core.validation.schemas.exceptions import ValidateError
 from openapi_core.validation.schemas.factories import SchemaValidatorsFactory
 from openapi_core.validation.validators import BaseAPICallValidator
 from openapi_core.validation.validators import BaseValidator
 from openapi_core.validation.validators import BaseWebhookValidator
 
+OPERATION_METHODS = (
+    "get",
+    "put",
+    "post",
+    "delete",
+    "options",
+    "head",
+    "patch",
+    "trace",
+)
+
 
 class BaseRequestValidator(BaseValidator):
     def __init__(
@@ -75,7 +94,10 @@ class BaseRequestValidator(BaseValidator):
             MediaTypeDeserializersDict
         ] = None,
         security_provider_factory: SecurityProviderFactory = security_provider_factory,
+        precompile: bool = False,
+        **kwargs: Any,
     ):
+        # remaining keyword arguments go to the next class in the MRO
         super().__init__(
             spec,
             base_url=base_url,
@@ -86,8 +108,57 @@ class BaseRequestValidator(BaseValidator):
             format_validators=format_validators,
             extra_format_validators=extra_format_validators,
             extra_media_type_deserializers=extra_media_type_deserializers,
+            **kwargs,
         )
         self.security_provider_factory = security_provider_factory
+        # effective (name, location, required, deprecated, parameter)
+        # list per operation
+        self._operation_parameters: Dict[
+            Spec, List[Tuple[str, str, bool, bool, Spec]]
+        ] = {}
+        # (request body, content) per operation
+        self._operation_request_bodies: Dict[
+            Spec, Optional[Tuple[Spec, Spec]]
+        ] = {}
+        # security requirements scheme names per operation
+        self._operation_security: Dict[Spec, List[List[str]]] = {}
+        # security providers created on first use per scheme
+        self._security_providers: Dict[str, Optional[BaseProvider]] = {}
+        if precompile:
+            self._precompile_all()
+
+    def _precompile_all(self) -> None:
+        paths = self.spec / self._paths_name
+        if not paths.exists():
+            return
+        for _, path in paths.items():
+            for method in OPERATION_METHODS:
+                if method not in path:
+                    continue
+                self._precompile_operation(path / method, path)
+
+    def _precompile_operation(self, operation: Spec, path: Spec) -> None:
+        operation_params = self._get_operation_parameters(operation, path)
+        for _, _, _, _, param in operation_params:
+            if "content" in param:
+                self._precompile_content(param / "content")
+            else:
+                self._precompile_schema(param / "schema")
+
+        self._get_operation_security(operation)
+
+        operation_request_body = self._get_operation_request_body(operation)
+        if operation_request_body is not None:
+            _, content = operation_request_body
+            self._precompile_content(content)
+
+    def _precompile_content(self, content: Spec) -> None:
+        for _, media_type in content.items():
+            if "schema" in media_type:
+                self._precompile_schema(media_type / "schema")
+
+    def _precompile_schema(self, schema: Spec) -> None:
+        self._get_schema_validator(schema)
 
     def _iter_errors(
         self, request: BaseRequest, operation: Spec, path: Spec
@@ -99,10 +170,10 @@ class BaseRequestValidator(BaseValidator):
             yield exc
             return
 
-        try:
-            self._get_parameters(request.parameters, operation, path)
-        except ParametersError as exc:
-            yield from exc.errors
+        _, params_errors = self._get_parameters_collect(
+            request.parameters, operation, path
+        )
+        yield from params_errors
 
         try:
             self._get_body(request.body, request.mimetype, operation)
@@ -120,10 +191,10 @@ class BaseRequestValidator(BaseValidator):
     def _iter_parameters_errors(
         self, request: BaseRequest, operation: Spec, path: Spec
     ) -> Iterator[Exception]:
-        try:
-            self._get_parameters(request.parameters, path, operation)
-        except ParametersError as exc:
-            yield from exc.errors
+        _, errors = self._get_parameters_collect(
+            request.parameters, operation, path
+        )
+        yield from errors
 
     def _iter_security_errors(
         self, request: BaseRequest, operation: Spec
@@ -139,83 +210,129 @@ class BaseRequestValidator(BaseValidator):
         operation: Spec,
         path: Spec,
     ) -> Parameters:
-        operation_params = operation.get("parameters", [])
-        path_params = path.get("parameters", [])
+        validated, errors = self._get_parameters_collect(
+            parameters, operation, path
+        )
+        if errors:
+            raise ParametersError(errors=errors, parameters=validated)
 
-        errors = []
-        seen = set()
-        validated = Parameters()
-        params_iter = chainiters(operation_params, path_params)
-        for param in params_iter:
-            param_name = param["name"]
-            param_location = param["in"]
-            if (param_name, param_location) in seen:
-                # skip parameter already seen
-                # e.g. overriden path item paremeter on operation
-                continue
-            seen.add((param_name, param_location))
+        return validated
+
+    def _get_parameters_collect(
+        self,
+        parameters: RequestParameters,
+        operation: Spec,
+        path: Spec,
+    ) -> Tuple[Parameters, List[ParameterValidationError]]:
+        operation_params = self._get_operation_parameters(operation, path)
+        if not operation_params:
+            return Parameters(), []
+
+        errors: List[ParameterValidationError] = []
+        locations: Dict[str, Dict[str, Any]] = {
+            "query": {},
+            "header": {},
+            "cookie": {},
+            "path": {},
+        }
+        for (
+            param_name,
+            param_location,
+            required,
+            deprecated,
+            param,
+        ) in operation_params:
             try:
-                value = self._get_parameter(parameters, param)
+                value = self._get_parameter(
+                    parameters,
+                    param,
+                    param_name,
+                    param_location,
+                    required,
+                    deprecated,
+                )
             except MissingParameter:
                 continue
             except ParameterValidationError as exc:
                 errors.append(exc)
                 continue
             else:
-                location = getattr(validated, param_location)
-                location[param_name] = value
+                locations[param_location][param_name] = value
 
-        if errors:
-            raise ParametersError(errors=errors, parameters=validated)
+        return Parameters(**locations), errors
 
-        return validated
+    def _get_operation_parameters(
+        self, operation: Spec, path: Spec
+    ) -> List[Tuple[str, str, bool, bool, Spec]]:
+        try:
+            return self._operation_parameters[operation]
+        except KeyError:
+            pass
+
+        operation_params = operation.get("parameters", [])
+        path_params = path.get("parameters", [])
+
+        params = []
+        seen = set()
+        for param in chainiters(operation_params, path_params):
+            # leaves are plain values, read them off the resolved content
+            param_content = param.content()
+            param_name = param_content["name"]
+            param_location = param_content["in"]
+            if (param_name, param_location) in seen:
+                # skip parameter already seen
+                # e.g. overriden path item paremeter on operation
+                continue
+            seen.add((param_name, param_location))
+            required = param_content.get("required", False)
+            deprecated = param_content.get("deprecated", False)
+            params.append(
+                (param_name, param_location, required, deprecated, param)
+            )
+
+        self._operation_parameters[operation] = params
+        return params
 
-    @ValidationErrorWrapper(
-        ParameterValidationError,
-        InvalidParameter,
-        "from_spec",
-        spec="param",
-    )
     def _get_parameter(
-        self, parameters: RequestParameters, param: Spec
+        self,
+        parameters: RequestParameters,
+        param: Spec,
+        name: str,
+        param_location: str,
+        required: bool,
+        deprecated: bool,
     ) -> Any:
-        name = param["name"]
-        deprecated = param.getkey("deprecated", False)
         if deprecated:
             warnings.warn(
                 f"{name} parameter is deprecated",
                 DeprecationWarning,
             )
 
-        param_location = param["in"]
         location = parameters[param_location]
 
         try:
             return self._get_param_or_header(param, location, name=name)
         except KeyError:
-            required = param.getkey("required", False)
             if required:
                 raise MissingRequiredParameter(name, param_location)
             raise MissingParameter(name, param_location)
+        except ParameterValidationError:
+            raise
+        except ValidateError as exc:
+            raise InvalidParameter(name, param_location) from exc
+        except OpenAPIError as exc:
+            raise ParameterValidationError(name, param_location) from exc
 
     @ValidationErrorWrapper(SecurityValidationError, InvalidSecurity)
     def _get_security(
         self, parameters: RequestParameters, operation: Spec
     ) -> Optional[Dict[str, str]]:
-        security = None
-        if "security" in self.spec:
-            security = self.spec / "security"
-        if "security" in operation:
-            security = operation / "security"
-
+        security = self._get_operation_security(operation)
         if not security:
             return {}
 
-        schemes = []
-        for security_requirement in security:
+        for scheme_names in security:
             try:
-                scheme_names = list(security_requirement.keys())
-                schemes.append(scheme_names)
                 return {
                     scheme_name: self._get_security_value(
                         parameters, scheme_name
@@ -225,32 +342,90 @@ class BaseRequestValidator(BaseValidator):
             except SecurityProviderError:
                 continue
 
+        schemes = [list(scheme_names) for scheme_names in security]
         raise SecurityNotFound(schemes)
 
+    def _get_operation_security(self, operation: Spec) -> List[List[str]]:
+        try:
+            return self._operation_security[operation]
+        except KeyError:
+            pass
+
+        # only scheme names are needed so raw requirements will do
+        security = operation.getkey("security")
+        if security is None:
+            security = self.spec.getkey("security")
+
+        requirements = []
+        if security:
+            for security_requirement in security:
+                requirements.append(list(security_requirement.keys()))
+
+        self._operation_security[operation] = requirements
+        return requirements
+
+    def _get_security_provider(
+        self, scheme_name: str
+    ) -> Optional[BaseProvider]:
+        try:
+            return self._security_providers[scheme_name]
+        except KeyError:
+            pass
+
+        # created lazily, providers for unsupported scheme types
+        # shouldn't break requests that other requirements satisfy
+        security_schemes = self._security_schemes
+        security_provider: Optional[BaseProvider] = None
+        if scheme_name in security_schemes:
+            scheme = security_schemes[scheme_name]
+            security_provider = self.security_provider_factory.create(scheme)
+
+        self._security_providers[scheme_name] = security_provider
+        return security_provider
+
     def _get_security_value(
         self, parameters: RequestParameters, scheme_name: str
     ) -> Any:
-        security_schemes = self.spec / "components#securitySchemes"
-        if scheme_name not in security_schemes:
+        security_provider = self._get_security_provider(scheme_name)
+        if security_provider is None:
             return
-        scheme = security_schemes[scheme_name]
-        security_provider = self.security_provider_factory.create(scheme)
         return security_provider(parameters)
 
+    @cached_property
+    def _security_schemes(self) -> Spec:
+        return self.spec / "components#securitySchemes"
+
     @ValidationErrorWrapper(RequestBodyValidationError, InvalidRequestBody)
     def _get_body(
         self, body: Optional[str], mimetype: str, operation: Spec
     ) -> Any:
-        if "requestBody" not in operation:
+        operation_request_body = self._get_operation_request_body(operation)
+        if operation_request_body is None:
             return None
 
         # TODO: implement required flag checking
-        request_body = operation / "requestBody"
-        content = request_body / "content"
+        request_body, content = operation_request_body
 
         raw_body = self._get_body_value(body, request_body)
         return self._convert_content_schema_value(raw_body, content, mimetype)
 
+    def _get_operation_request_body(
+        self, operation: Spec
+    ) -> Optional[Tuple[Spec, Spec]]:
+        try:
+            return self._operation_request_bodies[operation]
+        except KeyError:
+            pass
+
+        operation_request_body = None
+        request_body = operation.get("requestBody")
+        if request_body is not None:
+            content = request_body / "content"
+            operation_request_body = (request_body, content)
+
+        self._operation_request_bodies[operation] = operation_request_body
+        return operation_request_body
+
     def _get_body_value(self, body: Optional[str], request_body: Spec) -> Any:
         if not body:
             if request_body.getkey("required", False):
@@ -280,7 +455,7 @@ class BaseWebhookRequestValidator(BaseRequestValidator, BaseWebhookValidator):
 class APICallRequestBodyValidator(BaseAPICallRequestValidator):
     def iter_errors(self, request: Request) -> Iterator[Exception]:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         except PathError as exc:
             yield exc
             return
@@ -291,7 +466,9 @@ class APICallRequestBodyValidator(BaseAPICallRequestValidator):
 class APICallRequestParametersValidator(BaseAPICallRequestValidator):
     def iter_errors(self, request: Request) -> Iterator[Exception]:
         try:
-            path, operation, _, path_result, _ = self._find_path(request)
+            path, operation, _, path_result, _ = self._find_path_cached(
+                request
+            )
         except PathError as exc:
             yield exc
             return
@@ -306,7 +483,7 @@ class APICallRequestParametersValidator(BaseAPICallRequestValidator):
 class APICallRequestSecurityValidator(BaseAPICallRequestValidator):
     def iter_errors(self, request: Request) -> Iterator[Exception]:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         except PathError as exc:
             yield exc
             return
@@ -317,7 +494,9 @@ class APICallRequestSecurityValidator(BaseAPICallRequestValidator):
 class APICallRequestValidator(BaseAPICallRequestValidator):
     def iter_errors(self, request: Request) -> Iterator[Exception]:
         try:
-            path, operation, _, path_result, _ = self._find_path(request)
+            path, operation, _, path_result, _ = self._find_path_cached(
+                request
+            )
         # don't process if operation errors
         except PathError as exc:
             yield exc
@@ -333,7 +512,9 @@ class APICallRequestValidator(BaseAPICallRequestValidator):
 class WebhookRequestValidator(BaseWebhookRequestValidator):
     def iter_errors(self, request: WebhookRequest) -> Iterator[Exception]:
         try:
-            path, operation, _, path_result, _ = self._find_path(request)
+            path, operation, _, path_result, _ = self._find_path_cached(
+                request
+            )
         # don't process if operation errors
         except PathError as exc:
             yield exc
@@ -349,7 +530,7 @@ class WebhookRequestValidator(BaseWebhookRequestValidator):
 class WebhookRequestBodyValidator(BaseWebhookRequestValidator):
     def iter_errors(self, request: WebhookRequest) -> Iterator[Exception]:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         except PathError as exc:
             yield exc
             return
@@ -360,7 +541,9 @@ class WebhookRequestBodyValidator(BaseWebhookRequestValidator):
 class WebhookRequestParametersValidator(BaseWebhookRequestValidator):
     def iter_errors(self, request: WebhookRequest) -> Iterator[Exception]:
         try:
-            path, operation, _, path_result, _ = self._find_path(request)
+            path, operation, _, path_result, _ = self._find_path_cached(
+                request
+            )
         except PathError as exc:
             yield exc
             return
@@ -375,7 +558,7 @@ class WebhookRequestParametersValidator(BaseWebhookRequestValidator):
 class WebhookRequestSecurityValidator(BaseWebhookRequestValidator):
     def iter_errors(self, request: WebhookRequest) -> Iterator[Exception]:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         except PathError as exc:
             yield exc
             return
@@ -216,7 +216,7 @@ class APICallResponseDataValidator(BaseAPICallResponseValidator):
         response: Response,
     ) -> Iterator[Exception]:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         # don't process if operation errors
         except PathError as exc:
             yield exc
@@ -234,7 +234,7 @@ class APICallResponseHeadersValidator(BaseAPICallResponseValidator):
         response: Response,
     ) -> Iterator[Exception]:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         # don't process if operation errors
         except PathError as exc:
             yield exc
@@ -252,7 +252,7 @@ class APICallResponseValidator(BaseAPICallResponseValidator):
         response: Response,
     ) -> Iterator[Exception]:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         # don't process if operation errors
         except PathError as exc:
             yield exc
@@ -274,7 +274,7 @@ class WebhookResponseDataValidator(BaseWebhookResponseValidator):
         response: Response,
     ) -> Iterator[Exception]:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         # don't process if operation errors
         except PathError as exc:
             yield exc
@@ -292,7 +292,7 @@ class WebhookResponseHeadersValidator(BaseWebhookResponseValidator):
         response: Response,
     ) -> Iterator[Exception]:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         # don't process if operation errors
         except PathError as exc:
             yield exc
@@ -310,7 +310,7 @@ class WebhookResponseValidator(BaseWebhookResponseValidator):
         response: Response,
     ) -> Iterator[Exception]:
         try:
-            _, operation, _, _, _ = self._find_path(request)
+            _, operation, _, _, _ = self._find_path_cached(request)
         # don't process if operation errors
         except PathError as exc:
             yield exc
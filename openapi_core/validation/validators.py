@@ -1,12 +1,17 @@
 """OpenAPI core validation validators module"""
 import re
 from functools import cached_property
+from functools import lru_cache
 from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import Mapping
 from typing import Optional
 from typing import Tuple
 from urllib.parse import urljoin
 
+from jsonschema.protocols import Validator
+
 from openapi_core.casting.schemas import schema_casters_factory
 from openapi_core.casting.schemas.factories import SchemaCastersFactory
 from openapi_core.deserializing.media_types import (
@@ -31,7 +36,9 @@ from openapi_core.schema.parameters import get_style
 from openapi_core.schema.protocols import SuportsGetAll
 from openapi_core.schema.protocols import SuportsGetList
 from openapi_core.spec import Spec
+from openapi_core.templating.datatypes import TemplateResult
 from openapi_core.templating.media_types.datatypes import MediaType
+from openapi_core.templating.media_types.finders import MediaTypeFinder
 from openapi_core.templating.paths.datatypes import PathOperationServer
 from openapi_core.templating.paths.finders import APICallPathFinder
 from openapi_core.templating.paths.finders import BasePathFinder
@@ -39,9 +46,16 @@ from openapi_core.templating.paths.finders import WebhookPathFinder
 from openapi_core.validation.schemas.datatypes import FormatValidatorsDict
 from openapi_core.validation.schemas.factories import SchemaValidatorsFactory
 
+# found API call paths kept per validator
+FIND_PATH_CACHE_SIZE = 1024
+
 
 class BaseValidator:
     schema_validators_factory: SchemaValidatorsFactory = NotImplemented
+    # request attribute the found path is remembered in
+    _path_request_attr: str = NotImplemented
+    # spec section with the operations the validator serves
+    _paths_name: str = NotImplemented
 
     def __init__(
         self,
@@ -75,17 +89,41 @@ class BaseValidator:
         self.format_validators = format_validators
         self.extra_format_validators = extra_format_validators
         self.extra_media_type_deserializers = extra_media_type_deserializers
+        # compiled schema validators reused across requests
+        self._schema_validators: Dict[Spec, Validator] = {}
+        # media type finders per content
+        self._media_type_finders: Dict[Spec, MediaTypeFinder] = {}
+        # (style, explode, aslist) per parameter or header
+        self._styles: Dict[Spec, Tuple[str, bool, bool]] = {}
 
     def _find_media_type(
         self, content: Spec, mimetype: Optional[str] = None
     ) -> MediaType:
-        from openapi_core.templating.media_types.finders import MediaTypeFinder
-
-        finder = MediaTypeFinder(content)
+        finder = self._get_media_type_finder(content)
         if mimetype is None:
             return finder.get_first()
         return finder.find(mimetype)
 
+    def _get_media_type_finder(self, content: Spec) -> MediaTypeFinder:
+        try:
+            return self._media_type_finders[content]
+        except KeyError:
+            finder = MediaTypeFinder(content)
+            self._media_type_finders[content] = finder
+            return finder
+
+    def _get_style(self, param_or_header: Spec) -> Tuple[str, bool, bool]:
+        try:
+            return self._styles[param_or_header]
+        except KeyError:
+            style = (
+                get_style(param_or_header),
+                get_explode(param_or_header),
+                get_aslist(param_or_header),
+            )
+            self._styles[param_or_header] = style
+            return style
+
     def _deserialise_media_type(
         self, mimetype: str, parameters: Mapping[str, str], value: Any
     ) -> Any:
@@ -104,12 +142,20 @@ class BaseValidator:
         caster = self.schema_casters_factory.create(schema)
         return caster(value)
 
+    def _get_schema_validator(self, schema: Spec) -> Validator:
+        try:
+            return self._schema_validators[schema]
+        except KeyError:
+            validator = self.schema_validators_factory.create(
+                schema,
+                format_validators=self.format_validators,
+                extra_format_validators=self.extra_format_validators,
+            )
+            self._schema_validators[schema] = validator
+            return validator
+
     def _validate_schema(self, schema: Spec, value: Any) -> None:
-        validator = self.schema_validators_factory.create(
-            schema,
-            format_validators=self.format_validators,
-            extra_format_validators=self.extra_format_validators,
-        )
+        validator = self._get_schema_validator(schema)
         validator.validate(value)
 
     def _get_param_or_header(
@@ -216,7 +262,7 @@ class BaseValidator:
         name: Optional[str] = None,
     ) -> Any:
         name = name or param_or_header["name"]
-        style = get_style(param_or_header)
+        style, explode, aslist = self._get_style(param_or_header)
         if name not in location:
             # Only check if the name is not in the location if the style of
             # the param is deepObject,this is because deepObjects will never be found
@@ -227,8 +273,6 @@ class BaseValidator:
             if not re.search(rf"{name}\[\w+\]", keys_str):
                 raise KeyError
 
-        aslist = get_aslist(param_or_header)
-        explode = get_explode(param_or_header)
         if aslist and explode:
             if style == "deepObject":
                 return get_deep_object_value(location, name)
@@ -248,22 +292,89 @@ class BaseValidator:
         name = name or param_or_header["name"]
         return location[name]
 
+    def _get_path_key(self, request: Any) -> Tuple[str, str]:
+        raise NotImplementedError
+
+    def _find_path(self, request: Any) -> PathOperationServer:
+        raise NotImplementedError
+
+    def _find_path_cached(self, request: Any) -> PathOperationServer:
+        # reuse path found for the request by a validator of the same spec
+        key = self._get_path_key(request)
+        cached: Optional[
+            Tuple[Spec, Optional[str], Tuple[str, str], PathOperationServer]
+        ] = getattr(request, self._path_request_attr, None)
+        if cached is not None:
+            spec, base_url, cached_key, cached_result = cached
+            if (
+                spec is self.spec
+                and base_url == self.base_url
+                and cached_key == key
+            ):
+                return cached_result
+
+        result = self._find_path(request)
+        try:
+            setattr(
+                request,
+                self._path_request_attr,
+                (self.spec, self.base_url, key, result),
+            )
+        # e.g. request classes with __slots__
+        except AttributeError:
+            pass
+        return result
+
 
 class BaseAPICallValidator(BaseValidator):
+    _path_request_attr = "_openapi_core_path"
+    _paths_name = "paths"
+
     @cached_property
     def path_finder(self) -> BasePathFinder:
         return APICallPathFinder(self.spec, base_url=self.base_url)
 
-    def _find_path(self, request: Request) -> PathOperationServer:
+    def _get_path_key(self, request: Request) -> Tuple[str, str]:
         path_pattern = getattr(request, "path_pattern", None) or request.path
         full_url = urljoin(request.host_url, path_pattern)
-        return self.path_finder.find(request.method, full_url)
+        return request.method, full_url
+
+    @cached_property
+    def _found_paths(self) -> Callable[[str, str], PathOperationServer]:
+        # found API call paths by method and full url
+        return lru_cache(maxsize=FIND_PATH_CACHE_SIZE)(self.path_finder.find)
+
+    def _find_path(self, request: Request) -> PathOperationServer:
+        # the found path depends on method and full url only
+        key = self._get_path_key(request)
+        return self._find_path_by_key(key)
+
+    def _find_path_by_key(self, key: Tuple[str, str]) -> PathOperationServer:
+        found = self._found_paths(*key)
+
+        # fresh variables, request parameters may take and modify them
+        path, operation, server, path_result, server_result = found
+        return PathOperationServer(
+            path,
+            operation,
+            server,
+            TemplateResult(path_result.pattern, dict(path_result.variables)),
+            TemplateResult(
+                server_result.pattern, dict(server_result.variables)
+            ),
+        )
 
 
 class BaseWebhookValidator(BaseValidator):
+    _path_request_attr = "_openapi_core_webhook_path"
+    _paths_name = "webhooks"
+
     @cached_property
     def path_finder(self) -> BasePathFinder:
         return WebhookPathFinder(self.spec, base_url=self.base_url)
 
+    def _get_path_key(self, request: WebhookRequest) -> Tuple[str, str]:
+        return request.method, request.name
+
     def _find_path(self, request: WebhookRequest) -> PathOperationServer:
         return self.path_finder.find(request.method, request.name)
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from json import dumps
 
 import pytest
@@ -51,3 +52,35 @@ class TestFlaskOpenAPIValidation:
 
         assert result.status_code == 200
         assert result.json == {"data": "data"}
+
+    def test_request_unmarshaller_executor(self, spec, app_factory):
+        executor = ThreadPoolExecutor(max_workers=3)
+        unmarshaller = V30RequestUnmarshaller(spec, executor=executor)
+
+        def details_view_func(id):
+            from flask import request
+
+            openapi_request = FlaskOpenAPIRequest(request)
+            result = unmarshaller.unmarshal(openapi_request)
+            assert not result.errors
+
+            return Response(
+                dumps({"data": result.body}),
+                headers={"X-Rate-Limit": "12"},
+                mimetype="application/json",
+                status=200,
+            )
+
+        app = app_factory()
+        app.add_url_rule(
+            "/browse/<id>/",
+            view_func=details_view_func,
+            methods=["POST"],
+        )
+        data = {"param1": 1}
+        client = FlaskClient(app)
+        with executor:
+            result = client.post("/browse/12/", json=data)
+
+        assert result.status_code == 200
+        assert result.json == {"data": data}
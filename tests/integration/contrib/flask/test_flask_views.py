@@ -1,7 +1,11 @@
+import gc
+import weakref
+
 import pytest
 from flask import Flask
 from flask import jsonify
 from flask import make_response
+from flask import request
 
 from openapi_core.contrib.flask.views import FlaskOpenAPIView
 
@@ -207,3 +211,48 @@ class TestFlaskOpenAPIView:
         assert result.json == {
             "data": "data",
         }
+
+    def test_view_reused_across_requests(
+        self, client, app, spec, view_factory
+    ):
+        calls = []
+
+        def get(view, id):
+            calls.append((view, request._get_current_object()))
+            resp = jsonify(data=str(request.openapi.parameters.path["id"]))
+            resp.headers["X-Rate-Limit"] = "12"
+            return resp
+
+        view_func = view_factory(
+            spec, {"get": get, "init_every_request": False}
+        )
+        app.add_url_rule("/browse/<id>/", view_func=view_func)
+
+        result_1 = client.get("/browse/12/")
+        result_2 = client.get("/browse/13/")
+        result_3 = client.get("/browse/invalidparameter/")
+
+        assert result_1.status_code == 200
+        assert result_1.json == {
+            "data": "12",
+        }
+        assert result_2.status_code == 200
+        assert result_2.json == {
+            "data": "13",
+        }
+        assert result_3.status_code == 400
+        assert len(calls) == 2
+        (view_1, request_1), (view_2, request_2) = calls
+        assert view_1 is view_2
+        assert request_1 is not request_2
+
+    def test_view_freed_without_gc(self, spec):
+        view = FlaskOpenAPIView(spec)
+        view_ref = weakref.ref(view)
+
+        gc.disable()
+        try:
+            del view
+            assert view_ref() is None
+        finally:
+            gc.enable()
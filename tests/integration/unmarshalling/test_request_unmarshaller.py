@@ -1,5 +1,7 @@
 import json
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 import pytest
 
@@ -10,6 +12,9 @@ from openapi_core.templating.paths.exceptions import OperationNotFound
 from openapi_core.templating.paths.exceptions import PathNotFound
 from openapi_core.templating.security.exceptions import SecurityNotFound
 from openapi_core.testing import MockRequest
+from openapi_core.unmarshalling.request.unmarshallers import (
+    V30RequestBodyUnmarshaller,
+)
 from openapi_core.validation.request.exceptions import InvalidParameter
 from openapi_core.validation.request.exceptions import MissingRequiredParameter
 from openapi_core.validation.request.exceptions import (
@@ -412,3 +417,169 @@ class TestRequestUnmarshaller:
         assert result.security == {
             "petstore_auth": self.api_key_encoded,
         }
+
+    def test_get_pet_path_variables_not_shared(self, spec):
+        request_unmarshaller = V30RequestUnmarshaller(spec)
+        authorization = "Basic " + self.api_key_encoded
+        headers = {
+            "Authorization": authorization,
+        }
+        request = MockRequest(
+            self.host_url, "get", "/v1/pets/1", headers=headers
+        )
+        request_unmarshaller.unmarshal(request)
+        request.parameters.path["petId"] = "999"
+        other_request = MockRequest(
+            self.host_url, "get", "/v1/pets/1", headers=headers
+        )
+
+        result = request_unmarshaller.unmarshal(other_request)
+
+        assert result.errors == []
+        assert result.parameters == Parameters(
+            path={
+                "petId": 1,
+            },
+        )
+        assert other_request.parameters.path is not request.parameters.path
+
+    def test_unmarshal_overridden(self, spec):
+        class CustomRequestUnmarshaller(V30RequestUnmarshaller):
+            def _unmarshal(self, request, operation, path):
+                return "overridden"
+
+        class CustomRequestBodyUnmarshaller(V30RequestBodyUnmarshaller):
+            def _unmarshal_body(self, request, operation, path):
+                return "overridden"
+
+        request = MockRequest(self.host_url, "get", "/v1/pets/1")
+
+        assert CustomRequestUnmarshaller(spec).unmarshal(request) == (
+            "overridden"
+        )
+        assert CustomRequestBodyUnmarshaller(spec).unmarshal(request) == (
+            "overridden"
+        )
+
+    def test_schema_unmarshallers_reused(self, spec):
+        request_unmarshaller = V30RequestUnmarshaller(spec)
+        authorization = "Basic " + self.api_key_encoded
+        headers = {
+            "Authorization": authorization,
+        }
+
+        def get_request():
+            return MockRequest(
+                self.host_url,
+                "get",
+                "/v1/pets/1",
+                path_pattern="/v1/pets/{petId}",
+                view_args={"petId": "1"},
+                headers=headers,
+            )
+
+        request_unmarshaller.unmarshal(get_request())
+        with mock.patch.object(
+            request_unmarshaller.schema_unmarshallers_factory,
+            "create",
+        ) as create:
+            result = request_unmarshaller.unmarshal(get_request())
+
+        create.assert_not_called()
+        assert result.errors == []
+        assert result.parameters == Parameters(
+            path={
+                "petId": 1,
+            },
+        )
+
+    def test_precompile(self, spec):
+        request_unmarshaller = V30RequestUnmarshaller(spec, precompile=True)
+        authorization = "Basic " + self.api_key_encoded
+        headers = {
+            "Authorization": authorization,
+        }
+        request = MockRequest(
+            self.host_url,
+            "get",
+            "/v1/pets/1",
+            path_pattern="/v1/pets/{petId}",
+            view_args={"petId": "1"},
+            headers=headers,
+        )
+
+        with mock.patch.object(
+            request_unmarshaller.schema_unmarshallers_factory,
+            "create",
+        ) as create:
+            result = request_unmarshaller.unmarshal(request)
+
+        create.assert_not_called()
+        assert result.errors == []
+        assert result.parameters == Parameters(
+            path={
+                "petId": 1,
+            },
+        )
+
+    def test_post_pets_executor(self, spec):
+        data_json = {
+            "name": "Cat",
+            "ears": {
+                "healthy": True,
+            },
+        }
+        headers = {
+            "api-key": self.api_key_encoded,
+        }
+        cookies = {
+            "user": "123",
+        }
+        request = MockRequest(
+            "https://development.gigantic-server.com",
+            "post",
+            "/v1/pets",
+            path_pattern="/v1/pets",
+            data=json.dumps(data_json),
+            headers=headers,
+            cookies=cookies,
+        )
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            request_unmarshaller = V30RequestUnmarshaller(
+                spec, executor=executor
+            )
+            result = request_unmarshaller.unmarshal(request)
+
+        assert result.errors == []
+        assert result.parameters == Parameters(
+            header={
+                "api-key": self.api_key,
+            },
+            cookie={
+                "user": 123,
+            },
+        )
+        assert result.security == {}
+        assert result.body.name == "Cat"
+
+    def test_get_pet_unauthorized_executor(self, spec):
+        request = MockRequest(
+            self.host_url,
+            "get",
+            "/v1/pets/1",
+            path_pattern="/v1/pets/{petId}",
+            view_args={"petId": "1"},
+        )
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            request_unmarshaller = V30RequestUnmarshaller(
+                spec, executor=executor
+            )
+            result = request_unmarshaller.unmarshal(request)
+
+        assert len(result.errors) == 1
+        assert type(result.errors[0]) is SecurityValidationError
+        assert result.body is None
+        assert result.parameters == Parameters()
+        assert result.security is None
@@ -1,7 +1,11 @@
 from base64 import b64encode
+from unittest import mock
 
 import pytest
 
+from openapi_core import Spec
+from openapi_core import V31RequestUnmarshaller
+from openapi_core import V31RequestValidator
 from openapi_core.templating.security.exceptions import SecurityNotFound
 from openapi_core.testing import MockRequest
 from openapi_core.unmarshalling.request.unmarshallers import (
@@ -85,3 +89,92 @@ class TestSecurityOverride:
 
         assert not result.errors
         assert result.security == {}
+
+    def test_security_providers_reused(self, spec):
+        request_unmarshaller = V30RequestUnmarshaller(spec)
+        args = {"api_key": self.api_key}
+
+        request_unmarshaller.unmarshal(
+            MockRequest(self.host_url, "get", "/resource/one", args=args)
+        )
+        with mock.patch.object(
+            request_unmarshaller.security_provider_factory,
+            "create",
+        ) as create:
+            result = request_unmarshaller.unmarshal(
+                MockRequest(self.host_url, "get", "/resource/one", args=args)
+            )
+
+        create.assert_not_called()
+        assert not result.errors
+        assert result.security == {
+            "api_key": self.api_key,
+        }
+
+
+@pytest.fixture(scope="class")
+def unsupported_scheme_spec():
+    spec_dict = {
+        "openapi": "3.1.0",
+        "info": {
+            "title": "Unsupported security scheme",
+            "version": "0.1",
+        },
+        "security": [
+            {"key": []},
+            {"mtls": []},
+        ],
+        "paths": {
+            "/resource": {
+                "get": {
+                    "responses": {
+                        "default": {
+                            "description": "Default",
+                        },
+                    },
+                },
+            },
+        },
+        "components": {
+            "securitySchemes": {
+                "key": {
+                    "type": "apiKey",
+                    "in": "query",
+                    "name": "key",
+                },
+                "mtls": {
+                    "type": "mutualTLS",
+                },
+            },
+        },
+    }
+    return Spec.from_dict(spec_dict)
+
+
+class TestUnsupportedSecurityScheme:
+    host_url = "http://petstore.swagger.io"
+
+    def test_unmarshal(self, unsupported_scheme_spec):
+        request_unmarshaller = V31RequestUnmarshaller(unsupported_scheme_spec)
+        request = MockRequest(
+            self.host_url, "get", "/resource", args={"key": "v"}
+        )
+
+        result = request_unmarshaller.unmarshal(request)
+
+        assert not result.errors
+        assert result.security == {
+            "key": "v",
+        }
+
+    def test_validate_precompiled(self, unsupported_scheme_spec):
+        request_validator = V31RequestValidator(
+            unsupported_scheme_spec, precompile=True
+        )
+        request = MockRequest(
+            self.host_url, "get", "/resource", args={"key": "v"}
+        )
+
+        result = request_validator.validate(request)
+
+        assert result is None
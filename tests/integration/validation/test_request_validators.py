@@ -1,9 +1,13 @@
 import json
 from base64 import b64encode
+from unittest import mock
 
 import pytest
 
+from openapi_core import Spec
 from openapi_core import V30RequestValidator
+from openapi_core import V31RequestValidator
+from openapi_core import V31WebhookRequestValidator
 from openapi_core.datatypes import Parameters
 from openapi_core.templating.media_types.exceptions import MediaTypeNotFound
 from openapi_core.templating.paths.exceptions import OperationNotFound
@@ -18,10 +22,14 @@ from openapi_core.validation.request.exceptions import MissingRequiredParameter
 from openapi_core.validation.request.exceptions import (
     MissingRequiredRequestBody,
 )
+from openapi_core.validation.request.exceptions import ParameterValidationError
 from openapi_core.validation.request.exceptions import (
     RequestBodyValidationError,
 )
 from openapi_core.validation.request.exceptions import SecurityValidationError
+from openapi_core.validation.request.validators import (
+    V30RequestParametersValidator,
+)
 
 
 class TestRequestValidator:
@@ -132,3 +140,238 @@ class TestRequestValidator:
         result = request_validator.validate(request)
 
         assert result is None
+
+    def test_schema_validators_reused(self, spec):
+        request_validator = V30RequestValidator(spec)
+        authorization = "Basic " + self.api_key_encoded
+        headers = {
+            "Authorization": authorization,
+        }
+
+        def get_request():
+            return MockRequest(
+                self.host_url,
+                "get",
+                "/v1/pets/1",
+                path_pattern="/v1/pets/{petId}",
+                view_args={"petId": "1"},
+                headers=headers,
+            )
+
+        request_validator.validate(get_request())
+        with mock.patch.object(
+            request_validator.schema_validators_factory,
+            "create",
+        ) as create:
+            result = request_validator.validate(get_request())
+
+        create.assert_not_called()
+        assert result is None
+
+    def test_precompile(self, spec):
+        request_validator = V30RequestValidator(spec, precompile=True)
+        authorization = "Basic " + self.api_key_encoded
+        headers = {
+            "Authorization": authorization,
+        }
+        request = MockRequest(
+            self.host_url,
+            "get",
+            "/v1/pets/1",
+            path_pattern="/v1/pets/{petId}",
+            view_args={"petId": "1"},
+            headers=headers,
+        )
+
+        with mock.patch.object(
+            request_validator.schema_validators_factory,
+            "create",
+        ) as create:
+            result = request_validator.validate(request)
+
+        create.assert_not_called()
+        assert result is None
+
+    def test_path_reused(self, spec):
+        request_validator = V30RequestValidator(spec)
+        parameters_validator = V30RequestParametersValidator(spec)
+        authorization = "Basic " + self.api_key_encoded
+        headers = {
+            "Authorization": authorization,
+        }
+        request = MockRequest(
+            self.host_url,
+            "get",
+            "/v1/pets/1",
+            path_pattern="/v1/pets/{petId}",
+            view_args={"petId": "1"},
+            headers=headers,
+        )
+
+        request_validator.validate(request)
+        with mock.patch.object(
+            parameters_validator.path_finder, "find"
+        ) as find:
+            result = parameters_validator.validate(request)
+
+        find.assert_not_called()
+        assert result is None
+
+    def test_path_memoized(self, spec):
+        request_validator = V30RequestValidator(spec)
+        authorization = "Basic " + self.api_key_encoded
+        headers = {
+            "Authorization": authorization,
+        }
+        requests = [
+            MockRequest(
+                self.host_url,
+                "get",
+                "/v1/pets/1",
+                path_pattern="/v1/pets/{petId}",
+                view_args={"petId": "1"},
+                headers=headers,
+            )
+            for _ in range(2)
+        ]
+
+        with mock.patch.object(
+            request_validator.path_finder,
+            "find",
+            wraps=request_validator.path_finder.find,
+        ) as find:
+            for request in requests:
+                result = request_validator.validate(request)
+
+        find.assert_called_once()
+        assert result is None
+
+    def test_path_not_reused_other_spec(self, spec, spec_dict):
+        other_spec = Spec.from_dict(spec_dict)
+        request_validator = V30RequestValidator(spec)
+        other_request_validator = V30RequestValidator(other_spec)
+        request = MockRequest(
+            self.host_url,
+            "get",
+            "/v1/pets/1",
+            path_pattern="/v1/pets/{petId}",
+            view_args={"petId": "1"},
+        )
+
+        with pytest.raises(SecurityValidationError):
+            request_validator.validate(request)
+        with mock.patch.object(
+            other_request_validator.path_finder,
+            "find",
+            side_effect=PathNotFound("/v1/pets/1"),
+        ) as find:
+            with pytest.raises(PathNotFound):
+                other_request_validator.validate(request)
+
+        find.assert_called_once()
+
+    def test_path_not_reused_other_url(self, spec):
+        request_validator = V30RequestValidator(spec)
+        other_request_validator = V30RequestValidator(spec)
+        authorization = "Basic " + self.api_key_encoded
+        headers = {
+            "Authorization": authorization,
+        }
+        request = MockRequest(
+            self.host_url,
+            "get",
+            "/v1/pets/1",
+            path_pattern="/v1/pets/{petId}",
+            view_args={"petId": "1"},
+            headers=headers,
+        )
+
+        request_validator.validate(request)
+        request.method = "post"
+        request.path_pattern = "/v1/unknown"
+
+        with pytest.raises(PathNotFound):
+            other_request_validator.validate(request)
+
+    def test_parameter_error_stops_validate(self, spec):
+        def deserialize_failing(value, **parameters):
+            raise RuntimeError("body not reached")
+
+        request_validator = V30RequestValidator(
+            spec,
+            extra_media_type_deserializers={
+                "application/json": deserialize_failing,
+            },
+        )
+        headers = {
+            "api-key": self.api_key_encoded,
+        }
+        cookies = {
+            "user": "invalid",
+        }
+        request = MockRequest(
+            "https://development.gigantic-server.com",
+            "post",
+            "/v1/pets",
+            path_pattern="/v1/pets",
+            data=json.dumps({"name": "Cat"}),
+            headers=headers,
+            cookies=cookies,
+        )
+
+        with pytest.raises(ParameterValidationError):
+            request_validator.validate(request)
+
+
+class TestRequestValidatorPrecompile:
+    @pytest.fixture
+    def spec(self):
+        def operation(type):
+            return {
+                "post": {
+                    "requestBody": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"type": type},
+                            },
+                        },
+                    },
+                    "responses": {
+                        "200": {"description": "Ok"},
+                    },
+                },
+            }
+
+        return Spec.from_dict(
+            {
+                "openapi": "3.1.0",
+                "info": {
+                    "title": "Test precompile",
+                    "version": "0.1",
+                },
+                "paths": {
+                    "/pets": operation("object"),
+                },
+                "webhooks": {
+                    "newPet": operation("array"),
+                },
+            }
+        )
+
+    @pytest.mark.parametrize(
+        "validator_cls,schema_type",
+        [
+            (V31RequestValidator, "object"),
+            (V31WebhookRequestValidator, "array"),
+        ],
+    )
+    def test_served_operations_only(self, spec, validator_cls, schema_type):
+        with mock.patch.object(
+            validator_cls.schema_validators_factory,
+            "create",
+        ) as create:
+            validator_cls(spec, precompile=True)
+
+        assert create.call_count == 1
+        schema = create.call_args.args[0]
+        assert schema["type"] == schema_type
@@ -108,6 +108,28 @@ class TestMediaTypeDeserializer:
 
         assert result == {}
 
+    @pytest.mark.parametrize(
+        "mimetype",
+        [
+            "application/json",
+            "application/vnd.api+json",
+        ],
+    )
+    @pytest.mark.parametrize(
+        "value",
+        [
+            '{"name": "ąśźć"}',
+            '{"name": "ąśźć"}'.encode("utf-8"),
+        ],
+    )
+    def test_json_charset(self, deserializer_factory, mimetype, value):
+        parameters = {"charset": "utf-8"}
+        deserializer = deserializer_factory(mimetype, parameters=parameters)
+
+        result = deserializer.deserialize(value)
+
+        assert result == {"name": "ąśźć"}
+
     @pytest.mark.parametrize(
         "mimetype",
         [
@@ -9,8 +9,16 @@ from openapi_core import validate_request
 from openapi_core.casting.schemas.exceptions import CastError
 from openapi_core.datatypes import Parameters
 from openapi_core.testing import MockRequest
+from openapi_core.unmarshalling.request.unmarshallers import (
+    V30RequestParametersUnmarshaller,
+)
+from openapi_core.validation.request.exceptions import InvalidParameter
 from openapi_core.validation.request.exceptions import MissingRequiredParameter
 from openapi_core.validation.request.exceptions import ParameterValidationError
+from openapi_core.validation.request.validators import (
+    V30RequestParametersValidator,
+)
+from openapi_core.validation.schemas.exceptions import InvalidSchemaValue
 
 
 class TestPathItemParamsValidator:
@@ -114,6 +122,73 @@ class TestPathItemParamsValidator:
         assert result.body is None
         assert result.parameters == Parameters()
 
+    @pytest.fixture
+    def override_spec(self):
+        # operation parameter overrides required path item parameter
+        return Spec.from_dict(
+            {
+                "openapi": "3.0.0",
+                "info": {
+                    "title": "Test path item parameter override",
+                    "version": "0.1",
+                },
+                "paths": {
+                    "/resource": {
+                        "parameters": [
+                            {
+                                "name": "resId",
+                                "in": "query",
+                                "required": True,
+                                "schema": {
+                                    "type": "integer",
+                                },
+                            },
+                        ],
+                        "get": {
+                            "parameters": [
+                                {
+                                    "name": "resId",
+                                    "in": "query",
+                                    "required": False,
+                                    "schema": {
+                                        "type": "integer",
+                                    },
+                                },
+                            ],
+                            "responses": {
+                                "default": {
+                                    "description": "Return the resource."
+                                }
+                            },
+                        },
+                    }
+                },
+            }
+        )
+
+    def test_request_parameters_override_param(self, override_spec):
+        request = MockRequest("http://example.com", "get", "/resource")
+        result = unmarshal_request(
+            request,
+            override_spec,
+            base_url="http://example.com",
+            cls=V30RequestParametersUnmarshaller,
+        )
+
+        assert len(result.errors) == 0
+        assert result.parameters == Parameters()
+
+    def test_request_parameters_validate_override_param(self, override_spec):
+        request = MockRequest("http://example.com", "get", "/resource")
+        result = validate_request(
+            request,
+            override_spec,
+            base_url="http://example.com",
+            cls=V30RequestParametersValidator,
+        )
+
+        assert result is None
+
     def test_request_override_param_uniqueness(self, spec, spec_dict):
         # add parameter on operation with same name as on path but
         # different location
@@ -169,3 +244,166 @@ class TestPathItemParamsValidator:
         assert is_dataclass(result.parameters.query["paramObj"])
         assert result.parameters.query["paramObj"].count == 2
         assert result.parameters.query["paramObj"].name == "John"
+
+    def test_request_param_extra_format_unmarshallers(self):
+        spec = Spec.from_dict(
+            {
+                "openapi": "3.0.0",
+                "info": {
+                    "title": "Test path item parameter format",
+                    "version": "0.1",
+                },
+                "paths": {
+                    "/resource": {
+                        "parameters": [
+                            {
+                                "name": "resId",
+                                "in": "query",
+                                "schema": {
+                                    "type": "string",
+                                    "format": "custom",
+                                },
+                            },
+                        ],
+                        "get": {
+                            "responses": {
+                                "default": {
+                                    "description": "Return the resource."
+                                }
+                            },
+                        },
+                    }
+                },
+            }
+        )
+
+        def unmarshal_custom(value):
+            return f"x-{value}"
+
+        extra_format_unmarshallers = {
+            "custom": unmarshal_custom,
+        }
+        request_unmarshaller = V30RequestUnmarshaller(
+            spec,
+            extra_format_unmarshallers=extra_format_unmarshallers,
+        )
+        request = MockRequest(
+            "http://example.com",
+            "get",
+            "/resource",
+            args={"resId": "10"},
+        )
+
+        result = request_unmarshaller.unmarshal(request)
+
+        assert len(result.errors) == 0
+        assert result.parameters == Parameters(query={"resId": "x-10"})
+
+    def test_request_no_params_not_shared(self):
+        spec = Spec.from_dict(
+            {
+                "openapi": "3.0.0",
+                "info": {
+                    "title": "Test no parameters",
+                    "version": "0.1",
+                },
+                "paths": {
+                    "/resource": {
+                        "get": {
+                            "responses": {
+                                "default": {
+                                    "description": "Return the resource."
+                                }
+                            },
+                        },
+                    }
+                },
+            }
+        )
+        request_unmarshaller = V30RequestParametersUnmarshaller(spec)
+        request = MockRequest("http://example.com", "get", "/resource")
+
+        result = request_unmarshaller.unmarshal(request)
+        result.parameters.query["changed"] = True
+        other_result = request_unmarshaller.unmarshal(request)
+
+        assert other_result.errors == []
+        assert other_result.parameters == Parameters()
+
+
+class TestParameterErrors:
+    @pytest.fixture
+    def spec(self):
+        return Spec.from_dict(
+            {
+                "openapi": "3.0.0",
+                "info": {
+                    "title": "Test parameter errors",
+                    "version": "0.1",
+                },
+                "paths": {
+                    "/resource": {
+                        "parameters": [
+                            {
+                                "name": "resId",
+                                "in": "query",
+                                "required": True,
+                                "schema": {
+                                    "type": "integer",
+                                    "minimum": 1,
+                                },
+                            },
+                        ],
+                        "get": {
+                            "responses": {
+                                "default": {
+                                    "description": "Return the resource."
+                                }
+                            },
+                        },
+                    }
+                },
+            }
+        )
+
+    @pytest.fixture
+    def request_validator(self, spec):
+        return V30RequestParametersValidator(spec)
+
+    def test_invalid_value(self, request_validator):
+        request = MockRequest(
+            "http://example.com",
+            "get",
+            "/resource",
+            args={"resId": "0"},
+        )
+
+        errors = list(request_validator.iter_errors(request))
+
+        assert errors == [InvalidParameter(name="resId", location="query")]
+        assert type(errors[0].__cause__) is InvalidSchemaValue
+
+    def test_cast_error(self, request_validator):
+        request = MockRequest(
+            "http://example.com",
+            "get",
+            "/resource",
+            args={"resId": "invalid"},
+        )
+
+        errors = list(request_validator.iter_errors(request))
+
+        assert errors == [
+            ParameterValidationError(name="resId", location="query")
+        ]
+        assert type(errors[0].__cause__) is CastError
+
+    def test_missing_required(self, request_validator):
+        request = MockRequest("http://example.com", "get", "/resource")
+
+        errors = list(request_validator.iter_errors(request))
+
+        assert errors == [
+            MissingRequiredParameter(name="resId", location="query")
+        ]
+        assert errors[0].__cause__ is None
@@ -252,3 +252,19 @@ class TestOAS30SchemaUnmarshallerUnmarshal:
         result = unmarshaller.unmarshal(value)
 
         assert result == value
+
+    def test_object_property_default_invalid(self, unmarshaller_factory):
+        schema = {
+            "type": "object",
+            "properties": {
+                "count": {
+                    "type": "integer",
+                    "default": "invalid",
+                },
+            },
+        }
+        spec = Spec.from_dict(schema, validator=None)
+        unmarshaller = unmarshaller_factory(spec)
+
+        with pytest.raises(InvalidSchemaValue):
+            unmarshaller.unmarshal({})